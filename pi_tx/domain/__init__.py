@@ -9,6 +9,7 @@ Classes are organized into separate modules:
 - value: Value and Endpoint
 - mixing: DifferentialMix, AggregateSource, AggregateMix
 - model: Model (top-level configuration)
+- model_repository: ModelRepository (loads models from the models directory)
 
 All classes are re-exported here for convenient imports.
 """
@@ -17,6 +18,7 @@ All classes are re-exported here for convenient imports.
 from .value import Value, Endpoint
 from .mixing import DifferentialMix, AggregateSource, AggregateMix
 from .model import Model, ModelIcon, Channels
+from .model_repository import ModelRepository
 
 # Backward compatibility alias
 Channel = Value
@@ -32,4 +34,5 @@ __all__ = [
     "Model",
     "ModelIcon",
     "Channels",
+    "ModelRepository",
 ]
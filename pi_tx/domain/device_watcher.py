@@ -0,0 +1,101 @@
+"""
+Hot-plug detection for input devices using Linux inotify.
+
+Watches the directories containing configured device paths so a joystick
+plugged in after connect() can be opened as soon as its node appears,
+without re-scanning /dev/input.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+from typing import Dict, List
+
+IN_CREATE = 0x00000100
+IN_MOVED_TO = 0x00000080
+IN_DELETE_SELF = 0x00000400
+# Sent by the kernel (regardless of mask) when a watch is removed, e.g. the
+# watched directory was deleted
+IN_IGNORED = 0x00008000
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class DeviceWatcher:
+    """
+    Non-blocking inotify instance reporting paths created in watched directories.
+
+    The file descriptor is meant to be registered with an event loop
+    (e.g. loop.add_reader); call read_paths() when it becomes readable.
+    """
+
+    def __init__(self, mask: int = IN_CREATE | IN_MOVED_TO):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        self._mask = mask
+        self._watches: Dict[int, str] = {}  # watch descriptor -> directory
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def watch(self, path: str) -> bool:
+        """
+        Watch the nearest existing directory that will contain path.
+
+        Returns:
+            True if a watch is in place, False if none could be added.
+        """
+        directory = os.path.dirname(path)
+        while directory and not os.path.isdir(directory):
+            directory = os.path.dirname(directory.rstrip("/"))
+        if not directory or directory in self._watches.values():
+            return bool(directory)
+
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._mask)
+        if wd < 0:
+            return False
+        self._watches[wd] = directory
+        return True
+
+    def read_paths(self) -> List[str]:
+        """
+        Drain pending events and return the full paths that were created.
+
+        Watches on directories that were deleted are dropped; callers should
+        call watch() again for paths they still wait for.
+        """
+        paths = []
+        while True:
+            try:
+                buf = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & (IN_IGNORED | IN_DELETE_SELF):
+                    # The watched directory is gone (udev removes by-path once
+                    # its last device is unplugged); forget the dead watch so
+                    # the next watch() re-arms from an existing parent
+                    self._watches.pop(wd, None)
+                    continue
+                directory = self._watches.get(wd)
+                if directory is not None and name:
+                    paths.append(os.path.join(directory, os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
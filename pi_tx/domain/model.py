@@ -3,17 +3,75 @@ Top-level Model class for RC transmitter configuration.
 """
 
 import asyncio
-from dataclasses import dataclass, field
+import ctypes
+import errno
+import fcntl
+import logging
+import os
+import struct
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import List, Optional, Set, Union
+from typing import Callable, List, Optional, Set, Union
 from collections import defaultdict
 
-from evdev import InputDevice, ecodes
+from evdev import InputDevice
 
+from .device_watcher import DeviceWatcher
 from .value import Value
 from .mixing import DifferentialMix, AggregateMix
 from ..logging import get_logger
 
+# _IOW('E', 0x93, struct input_mask): restrict which events a client receives
+EVIOCSMASK = 0x40104593
+# struct input_mask { __u32 type; __u32 codes_size; __u64 codes_ptr; }
+_INPUT_MASK = struct.Struct("IIQ")
+# struct input_event { struct timeval time; __u16 type; __u16 code; __s32 value; }
+_INPUT_EVENT = struct.Struct("llHHi")
+_READ_BATCH = 64
+
+
+def _mask_event_types(fd: int, event_types: Set[int]):
+    """
+    Ask the kernel to deliver only the given event types on this fd.
+
+    Uses EVIOCSMASK with type 0, which masks whole event types. EV_SYN is
+    never filtered by the kernel. Raises OSError if unsupported.
+    """
+    bitmap = sum(1 << t for t in event_types).to_bytes(8, "little")
+    codes = ctypes.create_string_buffer(bitmap, len(bitmap))
+    request = _INPUT_MASK.pack(0, len(bitmap), ctypes.addressof(codes))
+    fcntl.ioctl(fd, EVIOCSMASK, request)
+
+
+async def _read_events(fd: int):
+    """
+    Yield (type, code, value) for every event read from a non-blocking evdev fd.
+
+    Reads up to _READ_BATCH events per syscall and unpacks the raw
+    input_event structs directly instead of building an InputEvent per event.
+    Raises OSError when the device goes away.
+    """
+    loop = asyncio.get_running_loop()
+    size = _INPUT_EVENT.size
+    while True:
+        try:
+            buf = os.read(fd, size * _READ_BATCH)
+        except BlockingIOError:
+            readable = loop.create_future()
+            loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
+            continue
+        if not buf:
+            raise OSError(errno.ENODEV, "Input device returned end of file")
+        # The kernel only hands out whole events; ignore any trailing fragment
+        usable = len(buf) - len(buf) % size
+        events = _INPUT_EVENT.iter_unpack(memoryview(buf)[:usable])
+        for _sec, _usec, event_type, code, value in events:
+            yield event_type, code, value
+
 
 class ModelIcon(str, Enum):
     """Available Material Design icons for RC models."""
@@ -84,9 +142,25 @@ class Model:
         # Initialize connection state
         self._devices: List[InputDevice] = []
         self._tasks: List[asyncio.Task] = []
+        self._watcher: Optional[DeviceWatcher] = None
+        self._pending_paths: Set[str] = set()
+        self._change_listener: Optional[Callable[[], None]] = None
         self._is_connected = False
         self._log = get_logger(f"{self.__class__.__name__}")
 
+        # (channel index, value name) for every mapped channel, in channel order
+        self._channel_slots: List[tuple[int, str]] = [
+            (i, name)
+            for i, name in enumerate(
+                getattr(self.channels, f.name) for f in fields(Channels)
+            )
+            if name is not None
+        ]
+        # (value name, bound postProcess) per value, walked by _postProcess
+        self._post_steps = [(v.name, v.postProcess) for v in self.values]
+        # Value lookup by name (names are unique, enforced by validate())
+        self._values_by_name: dict[str, Value] = {v.name: v for v in self.values}
+
         errors = self.validate()
         if errors:
             raise ValueError(
@@ -144,10 +218,7 @@ class Model:
 
     def get_value_by_name(self, value_name: str) -> Optional[Value]:
         """Get a value by its name."""
-        for v in self.values:
-            if v.name == value_name:
-                return v
-        return None
+        return self._values_by_name.get(value_name)
 
     def get_value_by_control_name(self, control_name: str) -> Optional[Value]:
         """Get a value by its control's name."""
@@ -156,10 +227,23 @@ class Model:
                 return v
         return None
 
+    def set_change_listener(self, listener: Optional[Callable[[], None]]):
+        """
+        Register a callable to run whenever raw_values change.
+
+        The listener is called from the thread running connect() and must be
+        cheap and thread-safe (e.g. a Kivy Clock trigger). Pass None to clear.
+        """
+        self._change_listener = listener
+
     def readValues(self) -> dict[str, float]:
-        self._process()
-        self._postProcess()
-        return self.processed_values.copy()
+        # readValues() runs on both the UART sender and the UI thread. Mix and
+        # post-process into a local dict and publish it once, so one caller can
+        # never post-process a dict another caller already post-processed.
+        values = self._mix()
+        self._post_process(values)
+        self.processed_values = values
+        return values.copy()
 
     def getChannels(self) -> List[float]:
         """
@@ -177,23 +261,21 @@ class Model:
         
         # Initialize all 14 channels to neutral (0.0)
         channel_list = [0.0] * 14
-        
-        # Use channel mapping
-        channel_fields = [
-            self.channels.ch_1, self.channels.ch_2, self.channels.ch_3,
-            self.channels.ch_4, self.channels.ch_5, self.channels.ch_6,
-            self.channels.ch_7, self.channels.ch_8, self.channels.ch_9,
-            self.channels.ch_10, self.channels.ch_11, self.channels.ch_12,
-            self.channels.ch_13, self.channels.ch_14
-        ]
-        
-        for i, value_name in enumerate(channel_fields):
-            if value_name is not None:
-                channel_list[i] = values_dict.get(value_name, 0.0)
-        
+
+        # Fill only the mapped channels, using the layout built at construction
+        for i, value_name in self._channel_slots:
+            channel_list[i] = values_dict.get(value_name, 0.0)
+
         return channel_list
 
     def _process(self):
+        # Store the mixed values
+        self.processed_values = self._mix()
+
+    def _postProcess(self):
+        self._post_process(self.processed_values)
+
+    def _mix(self) -> dict[str, float]:
         # Start with a copy of raw values
         values = dict(self.raw_values)
 
@@ -203,19 +285,12 @@ class Model:
             mixed = mix.compute(values)
             values.update(mixed)
 
-        # Store the mixed values
-        self.processed_values = values
-
-    def _postProcess(self):
-        for value_obj in self.values:
-            # Get the value (post-mixing or original)
-            value = self.processed_values.get(value_obj.name, 0.0)
+        return values
 
-            # Apply value post-processing
-            value = value_obj.postProcess(value)
-
-            # Update the processed value
-            self.processed_values[value_obj.name] = value
+    def _post_process(self, values: dict[str, float]):
+        for name, post_process in self._post_steps:
+            # Post-process the mixed (or original) value in place
+            values[name] = post_process(values.get(name, 0.0))
 
     async def connect(self):
         """
@@ -226,7 +301,9 @@ class Model:
         mixes, reversing, or endpoints. Call readValues() to process the collected values.
 
         Uses asyncio and evdev to monitor input events from all physical controls
-        configured in the model. Virtual controls are skipped.
+        configured in the model. Virtual controls are skipped. Devices that are
+        missing (or unplugged later) are watched with inotify and opened as
+        soon as they appear.
 
         Call disconnect() to gracefully stop listening and close devices.
 
@@ -241,107 +318,167 @@ class Model:
 
         # Gather unique device paths from all values (excluding values without controls)
         device_paths: Set[str] = set()
-        value_map = defaultdict(list)  # device_path -> list of (value, control)
+        # device_path -> {(event_type, event_code): [(value, control, normalize), ...]}
+        value_map = defaultdict(lambda: defaultdict(list))
 
         for value_obj in self.values:
-            if value_obj.control is None:
+            control = value_obj.control
+            if control is None or not hasattr(control, "event_code"):
                 continue
 
             # Get device_path from the control's device_path property
-            device_path = value_obj.control.device_path
+            device_path = control.device_path
             if device_path:
                 device_paths.add(device_path)
-                value_map[device_path].append((value_obj, value_obj.control))
+                key = (control.event_type.value, control.event_code)
+                # Axes scale their raw range; buttons report 0/1 as-is
+                normalize = getattr(control, "normalize", float)
+                value_map[device_path][key].append((value_obj, control, normalize))
 
         if not device_paths:
             self._log.warning("No physical input devices found in model configuration")
             return
 
-        # Open all devices
-        self._devices = []
-        for path in device_paths:
-            try:
-                dev = InputDevice(path)
-                self._devices.append(dev)
-                self._log.info(f"Opened device: {dev.name} at {path}")
-            except Exception as e:
-                self._log.warning(f"Could not open device {path}: {e}")
-
-        if not self._devices:
-            self._log.error("No devices could be opened")
-            return
-
-        self._log.info(
-            f"Listening to {len(self._devices)} device(s) for model '{self.name}'..."
-        )
-
-        # Track last values to detect changes
-        last_values = {}
         # Rate limiting: 100Hz = 10ms minimum interval between processing
         min_interval = 0.01  # 10ms = 100Hz
-        last_process_time = {}  # Track last process time per (device, code, type)
 
         # Create async tasks for each device
         async def monitor_device(device):
+            handlers = value_map[device.path]
+            # Last process time per (type, code), created up front for every
+            # mapped event so the hot loop can index it directly
+            last_process_time = dict.fromkeys(handlers, float("-inf"))
+            # Last raw value processed per (type, code); a repeat of it cannot
+            # change the result (latching only toggles on a 0 -> non-zero edge)
+            last_raw = dict.fromkeys(handlers)
+            clock = asyncio.get_running_loop().time
             try:
-                async for event in device.async_read_loop():
-                    # Skip sync and misc events
-                    if event.type in (ecodes.EV_SYN, ecodes.EV_MSC):
+                async for event_type, event_code, event_value in _read_events(
+                    device.fd
+                ):
+                    # Skip events no value is bound to (including sync and misc
+                    # events) before doing any other work
+                    event_key = (event_type, event_code)
+                    matching_values = handlers.get(event_key)
+                    if not matching_values or event_value == last_raw[event_key]:
                         continue
 
                     # Rate limiting check
-                    event_key = (device.path, event.code, event.type)
-                    current_time = asyncio.get_event_loop().time()
-                    last_time = last_process_time.get(event_key, 0)
-
-                    if current_time - last_time < min_interval:
+                    current_time = clock()
+                    if current_time - last_process_time[event_key] < min_interval:
                         # Skip processing if below 100Hz threshold
                         continue
 
                     last_process_time[event_key] = current_time
+                    last_raw[event_key] = event_value
 
-                    # Find matching values for this event
-                    matching_values = [
-                        (v, ctrl)
-                        for v, ctrl in value_map[device.path]
-                        if hasattr(ctrl, "event_code")
-                        and ctrl.event_code == event.code
-                        and ctrl.event_type.value == event.type
-                    ]
-
-                    for value_obj, control in matching_values:
-                        # Normalize the value
-                        if hasattr(control, "normalize"):
-                            # AxisControl
-                            normalized = control.normalize(event.value)
-                        else:
-                            # ButtonControl
-                            normalized = float(event.value)
+                    for value_obj, control, normalize in matching_values:
+                        normalized = normalize(event_value)
 
                         # Apply pre-processing (latching)
                         preprocessed = value_obj.preProcess(normalized)
 
                         # Check if value changed and store in raw_values
-                        if last_values.get(value_obj.name) != preprocessed:
-                            last_values[value_obj.name] = preprocessed
-                            self.raw_values[value_obj.name] = preprocessed
-
-                            self._log.debug(
-                                f"{value_obj.name} ({control.name}): "
-                                f"raw={event.value} norm={normalized:.3f} pre={preprocessed:.3f}"
-                            )
+                        raw_values = self.raw_values
+                        if raw_values.get(value_obj.name) != preprocessed:
+                            raw_values[value_obj.name] = preprocessed
+
+                            listener = self._change_listener
+                            if listener is not None:
+                                listener()
+
+                            # Skip building the message unless DEBUG is enabled
+                            if self._log.isEnabledFor(logging.DEBUG):
+                                self._log.debug(
+                                    f"{value_obj.name} ({control.name}): "
+                                    f"raw={event_value} norm={normalized:.3f} pre={preprocessed:.3f}"
+                                )
             except asyncio.CancelledError:
                 self._log.debug(f"Monitor task cancelled for device {device.path}")
                 raise
+            except OSError as e:
+                # Device was unplugged: close it and wait for it to reappear
+                self._log.warning(f"Lost device {device.path}: {e}")
+                for bound in handlers.values():
+                    for value_obj, _, _ in bound:
+                        # Fall back to neutral instead of the last reading
+                        self.raw_values.pop(value_obj.name, None)
+                if self._change_listener is not None:
+                    self._change_listener()
+                self._devices.remove(device)
+                try:
+                    device.close()
+                except Exception:
+                    pass
+                wait_for_device(device.path)
             except Exception as e:
                 self._log.error(
                     f"Error monitoring device {device.path}: {e}", exc_info=True
                 )
 
-        # Run all device monitors concurrently
-        self._tasks = [
-            asyncio.create_task(monitor_device(dev)) for dev in self._devices
-        ]
+        def open_device(path: str) -> bool:
+            """Open a device and start its monitor task."""
+            try:
+                dev = InputDevice(path)
+            except Exception as e:
+                self._log.warning(f"Could not open device {path}: {e}")
+                return False
+            try:
+                # Keep misc/unbound event types from waking the reader at all
+                _mask_event_types(dev.fd, {t for t, _ in value_map[path]})
+            except OSError as e:
+                self._log.debug(f"Kernel event mask unavailable for {path}: {e}")
+            self._pending_paths.discard(path)
+            self._devices.append(dev)
+            task = asyncio.create_task(monitor_device(dev))
+            self._tasks.append(task)
+            # A monitor exits when its device is unplugged; drop it so
+            # replug cycles do not accumulate finished tasks
+            task.add_done_callback(self._tasks.remove)
+            self._log.info(f"Opened device: {dev.name} at {path}")
+            return True
+
+        def on_device_created():
+            """Open pending devices once inotify reports new nodes."""
+            # Drain created paths and dropped watches (a watched directory may
+            # have been deleted); either way re-check every pending device
+            self._watcher.read_paths()
+            for path in list(self._pending_paths):
+                # Re-arm before checking so a node created right after the
+                # check is still reported; this watches closer in when a parent
+                # directory appeared, or from an existing parent when it vanished
+                self._watcher.watch(path)
+                if os.path.exists(path):
+                    open_device(path)
+
+        def wait_for_device(path: str):
+            """Remember a missing device and watch for it to be plugged in."""
+            self._pending_paths.add(path)
+            if self._watcher is None:
+                try:
+                    self._watcher = DeviceWatcher()
+                except (OSError, AttributeError) as e:
+                    self._log.warning(f"Hot-plug detection unavailable: {e}")
+                    return
+                loop.add_reader(self._watcher.fileno(), on_device_created)
+            self._watcher.watch(path)
+
+        # Open all devices and run their monitors concurrently; devices that
+        # are not present yet are picked up when they are plugged in
+        loop = asyncio.get_running_loop()
+        self._devices = []
+        self._tasks = []
+        for path in device_paths:
+            if not open_device(path):
+                wait_for_device(path)
+
+        if not self._devices and self._watcher is None:
+            self._log.error("No devices could be opened")
+            return
+
+        self._log.info(
+            f"Listening to {len(self._devices)} device(s) for model '{self.name}'..."
+        )
         self._is_connected = True
         self._log.info(f"Model '{self.name}' connected successfully")
 
@@ -375,6 +512,13 @@ class Model:
             except Exception as e:
                 self._log.warning(f"Error closing device {dev.path}: {e}")
 
+        # Stop watching for hot-plugged devices
+        if self._watcher is not None:
+            asyncio.get_running_loop().remove_reader(self._watcher.fileno())
+            self._watcher.close()
+            self._watcher = None
+        self._pending_paths.clear()
+
         # Clear state
         self._devices = []
         self._tasks = []
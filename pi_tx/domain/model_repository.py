@@ -0,0 +1,128 @@
+"""
+Loading of Model definitions from the models directory.
+
+Each model lives in its own Python module (models/<name>.py) that defines
+a Model instance, by convention in a variable named after the file.
+"""
+
+import importlib.util
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import CodeType
+from typing import Dict, List, Optional, Tuple
+
+from .model import Model
+
+# Compiled model modules keyed by (path, st_mtime_ns, st_size)
+_CODE_CACHE: "OrderedDict[Tuple[str, int, int], CodeType]" = OrderedDict()
+_CODE_CACHE_SIZE = 16
+_CODE_CACHE_LOCK = threading.Lock()
+# Sorted model names per directory, with the directory st_mtime_ns they were read at
+_LISTING_CACHE: Dict[str, Tuple[int, List[str]]] = {}
+
+
+def _compile_cached(path: Path) -> CodeType:
+    """
+    Read and compile a model module, reusing the result while the file is unchanged.
+
+    Editing the file changes its mtime/size, so stale entries are never hit;
+    they simply age out of the LRU.
+    """
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    with _CODE_CACHE_LOCK:
+        code = _CODE_CACHE.get(key)
+        if code is not None:
+            _CODE_CACHE.move_to_end(key)
+            return code
+
+    code = compile(Path(path).read_bytes(), str(path), "exec")
+    # Models may be loaded from a worker thread (icons) and the UI thread at once
+    with _CODE_CACHE_LOCK:
+        _CODE_CACHE[key] = code
+        if len(_CODE_CACHE) > _CODE_CACHE_SIZE:
+            _CODE_CACHE.popitem(last=False)
+    return code
+
+
+class ModelRepository:
+    """Finds and loads models from a directory of model modules."""
+
+    DEFAULT_ICON = "excavator"
+
+    def __init__(self, models_dir: Path):
+        self.models_dir = Path(models_dir)
+
+    def path_for(self, model_name: str) -> Path:
+        return self.models_dir / f"{model_name}.py"
+
+    def list_models(self) -> List[str]:
+        """
+        Return the sorted names of all model modules in the directory.
+
+        The scan is reused until the directory mtime changes, which happens
+        whenever a model file is added, removed or renamed. A missing
+        directory yields an empty list.
+        """
+        directory = str(self.models_dir)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            cached = _LISTING_CACHE.get(directory)
+            if cached is not None and cached[0] == mtime:
+                return list(cached[1])
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            _LISTING_CACHE.pop(directory, None)
+            return []
+
+        # Name checks first; is_file() comes from the dirent type, not a stat
+        with entries:
+            names = [
+                entry.name[:-3]
+                for entry in entries
+                if entry.name[-3:] == ".py" and entry.name[0] != "_" and entry.is_file()
+            ]
+        names.sort()
+        _LISTING_CACHE[directory] = (mtime, names)
+        return list(names)
+
+    def load(self, model_name: str, model_path: Optional[Path] = None) -> Model:
+        """
+        Load a fresh Model instance from its module.
+
+        The module is executed on every call so each load gets its own Model
+        (models hold runtime state); only reading and compiling is cached.
+
+        Raises:
+            ImportError: If the module cannot be loaded
+            AttributeError: If the module does not define a Model
+        """
+        model_path = Path(model_path or self.path_for(model_name))
+        spec = importlib.util.spec_from_file_location(model_name, model_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load model from {model_path}")
+
+        module = importlib.util.module_from_spec(spec)
+        exec(_compile_cached(model_path), module.__dict__)
+
+        # Convention: model variable has same name as file
+        model = getattr(module, model_name, None)
+        if isinstance(model, Model):
+            return model
+
+        # Otherwise use the first Model instance in the module
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if isinstance(attr, Model):
+                return attr
+        raise AttributeError(f"No Model instance found in {model_name}")
+
+    def icon_for(self, model_name: str, model_path: Optional[Path] = None) -> str:
+        """Return the icon name of a model, or DEFAULT_ICON if it has none."""
+        icon = getattr(self.load(model_name, model_path), "icon", None)
+        if icon is None:
+            return self.DEFAULT_ICON
+        # Icon can be either a ModelIcon enum or a string
+        return icon.value if hasattr(icon, "value") else str(icon)
@@ -57,6 +57,22 @@ class AxisControl(Control):
     fuzz: int = 63
     flat: int = 1023
 
+    def __post_init__(self):
+        """Precompute normalization coefficients used on every input event."""
+        span = self.max_value - self.min_value
+        bipolar = self.control_type == ControlType.BIPOLAR
+        out_min = -1.0 if bipolar else 0.0
+        # Affine map raw -> out_min..1.0 (a zero span collapses to out_min)
+        scale = (1.0 - out_min) / span if span else 0.0
+        # (scale, offset, out_min, out_max, deadzone)
+        self._norm = (
+            scale,
+            out_min - self.min_value * scale,
+            out_min,
+            1.0,
+            0.05 if bipolar else 0.0,
+        )
+
     def normalize(self, raw_value: int) -> float:
         """
         Normalize raw hardware value to -1.0..1.0 (bipolar) or 0.0..1.0 (unipolar).
@@ -67,27 +83,13 @@ class AxisControl(Control):
         Returns:
             Normalized value
         """
-        # Clamp to min/max
-        value = max(self.min_value, min(self.max_value, raw_value))
-
-        # Normalize to 0.0 to 1.0
-        range_size = self.max_value - self.min_value
-        if range_size == 0:
-            normalized = 0.0
-        else:
-            normalized = (value - self.min_value) / range_size
-
-        # Convert to appropriate range
-        if self.control_type == ControlType.BIPOLAR:
-            # Convert 0..1 to -1..1
-            result = normalized * 2.0 - 1.0
-            # Apply small center deadzone for bipolar axes
-            if abs(result) < 0.05:
-                return 0.0
-            return result
-        else:
-            # Keep as 0..1 for unipolar
-            return normalized
+        scale, offset, out_min, out_max, deadzone = self._norm
+        result = raw_value * scale + offset
+        # Clamp, then apply the small center deadzone (bipolar axes only)
+        result = (
+            out_max if result > out_max else out_min if result < out_min else result
+        )
+        return 0.0 if -deadzone < result < deadzone else result
 
 
 @dataclass
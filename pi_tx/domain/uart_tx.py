@@ -4,9 +4,11 @@ Supports AFHDS2A protocol (compatible with FS-iA10B receiver).
 """
 
 import logging
+import sys
 import threading
 import time
 import os
+from array import array
 from typing import Callable, Optional, Sequence, Iterable
 import serial
 
@@ -113,9 +115,9 @@ class MultiSerialTX:
         self._option = option
         self._frame_rate_hz = frame_rate_hz
 
-        # Channels
+        # Channels, kept as unsigned 16-bit so the frame payload is one copy
         self._num_channels = channel_count
-        self._channels = [1024] * self._num_channels
+        self._channels = array("H", [1024] * self._num_channels)
 
         # Flags
         self._bind_mode = False
@@ -123,7 +125,7 @@ class MultiSerialTX:
         self._autobind = False
 
         # Threading / sampler
-        self._stop_flag = False
+        self._stop_event = threading.Event()
         self._sender_thread = None
         self._sampler = None
         self._sampler_normalized = True
@@ -186,10 +188,11 @@ class MultiSerialTX:
         Set multiple channels. values can be a list/tuple of ints.
         Automatically clamps to [0..2047].
         """
-        for i, val in enumerate(values):
-            if i >= self._num_channels:
-                break
-            self.set_channel(i, val)
+        # zip() against the channel range bounds the loop once instead of
+        # range-checking every index in set_channel()
+        channels = self._channels
+        for i, val in zip(range(self._num_channels), values):
+            channels[i] = max(0, min(2047, int(val)))
 
     # ---- Sampler registration ----
     def set_sampler(
@@ -226,13 +229,14 @@ class MultiSerialTX:
         # Frame starts with: header, protocol, flags, option, rx_num
         frame = bytearray([0x55, self._protocol_id, flags, option_byte, self._rx_num])
 
-        # Add channels (11-bit each, little-endian)
-        for ch_val in self._channels:
-            # Clamp to 11-bit just in case
-            val = max(0, min(2047, ch_val))
-            lo = val & 0xFF
-            hi = (val >> 8) & 0x07
-            frame.extend([lo, hi])
+        # Add channels (11-bit each, little-endian). set_channel() already
+        # clamps to 0..2047, so each value is exactly its uint16 lo/hi pair.
+        if sys.byteorder == "little":
+            frame += self._channels.tobytes()
+        else:
+            channels = array("H", self._channels)
+            channels.byteswap()
+            frame += channels.tobytes()
 
         # XOR checksum over bytes [1..last] (exclude the 0x55 header)
         checksum = 0
@@ -248,13 +252,13 @@ class MultiSerialTX:
         if self._sender_thread and self._sender_thread.is_alive():
             return  # already running
 
-        self._stop_flag = False
+        self._stop_event.clear()
         self._sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
         self._sender_thread.start()
 
     def stop(self):
         """Stop the periodic frame transmission."""
-        self._stop_flag = True
+        self._stop_event.set()
         if self._sender_thread:
             self._sender_thread.join(timeout=1.0)
             self._sender_thread = None
@@ -268,21 +272,14 @@ class MultiSerialTX:
         interval = 1.0 / self._frame_rate_hz
         # Use perf_counter for better monotonic timing
         perf = time.perf_counter
+        stop_event = self._stop_event
         next_send = perf()
         drift_resets = 0
-        while not self._stop_flag:
-            now = perf()
-            # Sleep until scheduled send time with drift correction
-            remaining = next_send - now
-            if remaining > 0.0008:  # more than ~0.8ms: coarse sleep then fine spin
-                # Leave ~0.3ms for spin to reduce oversleep
-                coarse = remaining - 0.0003
-                if coarse > 0:
-                    time.sleep(coarse)
-            # Fine wait (spin/yield) until deadline or stop
-            while not self._stop_flag and perf() < next_send:
-                # brief yield to OS
-                time.sleep(0)
+        while not stop_event.is_set():
+            # Block until the scheduled send time; stop() wakes us immediately
+            remaining = next_send - perf()
+            if remaining > 0 and stop_event.wait(remaining):
+                break
             # Build & send frame
             try:
                 if self._sampler:
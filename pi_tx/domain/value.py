@@ -8,7 +8,7 @@ from typing import Union, Optional
 from pi_tx.domain.stick_mapping import AxisControl, ButtonControl, ControlType
 
 
-@dataclass
+@dataclass(slots=True)
 class Endpoint:
     """
     Represents the output range limits for a value.
@@ -65,20 +65,19 @@ class Value:
         self._last_input: float = 0.0
 
     def preProcess(self, value: float) -> float:
-        # Apply latching if enabled
-        if self.latching:
-            # Detect rising edge: transition from zero to non-zero
-            if self._last_input == 0.0 and value != 0.0:
-                # Toggle the latch state
-                self._latch_state = 1.0 if self._latch_state == 0.0 else 0.0
+        # Non-latching values pass straight through
+        if not self.latching:
+            return value
 
-            # Update last input for next comparison
-            self._last_input = value
+        # Rising edge (zero to non-zero) flips the latch between 0.0 and 1.0
+        if self._last_input == 0.0 and value != 0.0:
+            self._latch_state = 1.0 - self._latch_state
 
-            # Use the latched state as the value
-            value = self._latch_state
+        # Update last input for next comparison
+        self._last_input = value
 
-        return value
+        # Use the latched state as the value
+        return self._latch_state
 
     def postProcess(self, value: float) -> float:
         # Apply reversing
@@ -1,45 +1,60 @@
 """Channel bar widget for displaying channel values."""
 from __future__ import annotations
 from kivy.uix.widget import Widget
+from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle
 from kivy.properties import NumericProperty, StringProperty, ListProperty
 from kivy.metrics import dp
 
+_BG_COLOR = (0.18, 0.18, 0.18, 1)
+_BAR_COLOR = (0.22, 0.55, 0.95, 1)
+
 
 class ChannelBar(Widget):
     value = NumericProperty(0.0)
     channel_type = StringProperty("unipolar")
-    bar_color = ListProperty([0, 0.6, 1, 1])
+    bar_color = ListProperty(_BAR_COLOR)
 
     def __init__(self, channel_type: str, **kw):
         super().__init__(**kw)
         self.channel_type = channel_type or "unipolar"
-        self._bg_color = (0.18, 0.18, 0.18, 1)
-        self._update_bar_color()
+        # Instructions are created once; redraws only move and resize them.
+        # The static background lives in canvas.before and only follows layout.
+        with self.canvas.before:
+            Color(*_BG_COLOR)
+            self._bg_rect = Rectangle(pos=self.pos, size=self.size)
+        with self.canvas:
+            self._bar_col = Color(*self.bar_color)
+            self._bar_rect = Rectangle(pos=self.pos, size=(0, self.height))
+        # pos, size and value often change together (layout, rebuild); draw once
+        # per frame for all of them
+        self._trigger_redraw = Clock.create_trigger(self._redraw, -1)
         self.bind(
-            pos=lambda *_: self._redraw(),
-            size=lambda *_: self._redraw(),
-            value=lambda *_: self._redraw(),
+            pos=self._on_layout,
+            size=self._on_layout,
+            value=self._trigger_redraw,
         )
+        self.bind(bar_color=self._on_bar_color)
 
-    def _update_bar_color(self):
-        self.bar_color = [0.22, 0.55, 0.95, 1]
+    def _on_layout(self, *_):
+        self._bg_rect.pos = self.pos
+        self._bg_rect.size = self.size
+        self._trigger_redraw()
 
-    def _redraw(self):
+    def _redraw(self, *_):
         """Draw value in normalized range -1.0..1.0 always centered.
 
         Negative values extend left from center, positive to the right.
         Magnitude saturates at the half-width.
         """
-        self.canvas.clear()
-        with self.canvas:
-            Color(*self._bg_color)
-            Rectangle(pos=self.pos, size=self.size)
-            val = max(-1.0, min(1.0, float(self.value)))
-            half_w = max(1.0, self.width / 2.0)
-            center_x = self.x + half_w
-            magnitude = abs(val) * half_w
-            bar_x = center_x if val >= 0 else center_x - magnitude
-            bar_w = magnitude
-            Color(*self.bar_color)
-            Rectangle(pos=(bar_x, self.y), size=(bar_w, self.height))
+        val = max(-1.0, min(1.0, float(self.value)))
+        half_w = max(1.0, self.width / 2.0)
+        center_x = self.x + half_w
+        magnitude = abs(val) * half_w
+        bar_x = center_x if val >= 0 else center_x - magnitude
+        bar_w = magnitude
+        self._bar_rect.pos = (bar_x, self.y)
+        self._bar_rect.size = (bar_w, self.height)
+
+    def _on_bar_color(self, _instance, color):
+        self._bar_col.rgba = color
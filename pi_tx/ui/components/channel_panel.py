@@ -19,32 +19,64 @@ class ChannelPanel(MDBoxLayout):
         )
         self.bind(minimum_height=self.setter("height"))
         self.rows = {}
+        # Flat (snapshot index, row) slots plus the last value shown per slot
+        self._slots: list[tuple[int, ChannelRow]] = []
+        self._shown: list[float] = []
+        # Slot position per snapshot index (None where no row is shown)
+        self._slot_of: list[int | None] = []
+        # Rows are reused across rebuilds instead of being re-instantiated
+        self._row_pool: list[ChannelRow] = []
 
-    def rebuild(self, mapping: dict[str, dict]):
+    def rebuild(self, mapping: dict[int | str, dict]):
         self.clear_widgets()
         self.rows.clear()
+        self._slots = []
+        self._shown = []
+        self._slot_of = []
         if not mapping:
             self.add_widget(MDLabel(text="No channels configured", halign="center"))
             return
-        for ch_str in sorted(mapping.keys(), key=lambda x: int(x)):
-            ch = int(ch_str)
-            ch_info = mapping[ch_str]
+        # Channel numbers are unique so ties never compare dicts; string keys
+        # are still accepted
+        for ch, ch_info in sorted((int(k), v) for k, v in mapping.items()):
             ch_type = ch_info.get("control_type", ch_info.get("type", "unipolar"))
             ctrl_code = str(ch_info.get("control_code", ""))
             if (not ch_info.get("device_path")) or (not ctrl_code.isdigit()):
                 ch_type = "virtual"
-            row = ChannelRow(ch, ch_type)
+            if len(self._slots) < len(self._row_pool):
+                row = self._row_pool[len(self._slots)]
+                row.configure(ch, ch_type)
+            else:
+                row = ChannelRow(ch, ch_type)
+                self._row_pool.append(row)
             row.update_value(0.0)
             self.rows[ch] = row
+            self._slots.append((ch - 1, row))
+            self._shown.append(0.0)
             self.add_widget(row)
+        self._slot_of = [None] * (max(idx for idx, _ in self._slots) + 1)
+        for i, (idx, _row) in enumerate(self._slots):
+            self._slot_of[idx] = i
 
     def update_values(self, snapshot: list[float]):
-        # Pre-calculate length to avoid repeated len() calls
         snapshot_len = len(snapshot)
-        
-        for ch, row in self.rows.items():
-            idx = ch - 1
+        shown = self._shown
+
+        # Only repaint rows whose value differs from what is on screen
+        for i, (idx, row) in enumerate(self._slots):
             val = snapshot[idx] if idx < snapshot_len else 0.0
-            # Only update if value actually changed (avoid unnecessary UI updates)
-            if row.bar.value != val:
+            if shown[i] != val:
+                shown[i] = val
                 row.update_value(val)
+
+    def update_changed(self, changes: dict[int, float]):
+        """Repaint only the rows for the given {snapshot index: value} deltas."""
+        shown = self._shown
+        slots = self._slots
+        slot_of = self._slot_of
+        slot_count = len(slot_of)
+        for idx, val in changes.items():
+            i = slot_of[idx] if idx < slot_count else None
+            if i is not None and shown[i] != val:
+                shown[i] = val
+                slots[i][1].update_value(val)
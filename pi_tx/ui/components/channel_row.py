@@ -5,31 +5,45 @@ from kivymd.uix.label import MDLabel
 from kivy.metrics import dp
 from .channel_bar import ChannelBar
 
+# Metrics do not change after start-up, so convert once at import
+_ROW_HEIGHT = dp(32)
+_ROW_GAP = dp(8)
+_LABEL_WIDTH = dp(60)
+
 
 class ChannelRow(MDBoxLayout):
     def __init__(self, channel_number: int, channel_type: str, **kw):
         super().__init__(
             orientation="horizontal",
             size_hint_y=None,
-            height=dp(32),
-            padding=(dp(8), 0, dp(8), 0),
-            spacing=dp(8),
+            height=_ROW_HEIGHT,
+            padding=(_ROW_GAP, 0, _ROW_GAP, 0),
+            spacing=_ROW_GAP,
             **kw,
         )
-        self.channel_number = channel_number
-        self.channel_type = channel_type or "unipolar"
-        base_label = f"ch{channel_number}"
-        self.label = MDLabel(text=base_label, size_hint_x=None, width=dp(60))
-        self.bar = ChannelBar(self.channel_type, size_hint_x=1)
+        self.label = MDLabel(size_hint_x=None, width=_LABEL_WIDTH)
+        self.bar = ChannelBar(channel_type, size_hint_x=1)
         self.value_label = MDLabel(
-            text="0.00", size_hint_x=None, width=dp(60), halign="right"
+            text="0.00", size_hint_x=None, width=_LABEL_WIDTH, halign="right"
         )
         self.add_widget(self.label)
         self.add_widget(self.bar)
         self.add_widget(self.value_label)
+        self.configure(channel_number, channel_type)
+
+    def configure(self, channel_number: int, channel_type: str):
+        """Point this row at a (possibly different) channel, keeping its widgets."""
+        self.channel_number = channel_number
+        self.channel_type = channel_type or "unipolar"
+        self._value_format = "+.2f" if self.channel_type == "bipolar" else ".2f"
+        self._shown_value = None  # Value rounded to what the label displays
+        self.label.text = f"ch{channel_number}"
+        self.bar.channel_type = self.channel_type
 
     def update_value(self, value: float):
         self.bar.value = value
-        self.value_label.text = (
-            f"{value:+.2f}" if self.channel_type == "bipolar" else f"{value:.2f}"
-        )
+        # Skip formatting and label re-layout when the displayed digits are unchanged
+        shown = round(value, 2)
+        if shown != self._shown_value:
+            self._shown_value = shown
+            self.value_label.text = format(value, self._value_format)
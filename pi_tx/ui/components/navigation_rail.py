@@ -1,6 +1,8 @@
 """Navigation rail component for the main app."""
 from __future__ import annotations
 
+from functools import partial
+
 from kivymd.uix.navigationrail import MDNavigationRail, MDNavigationRailItem
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.label import MDLabel
@@ -60,19 +62,19 @@ class MainNavigationRail(MDBoxLayout):
             text="Live",
             icon="view-list",
         )
-        self.channels_item.bind(on_release=lambda x: self._switch_view("channels"))
+        self.channels_item.bind(on_release=partial(self._switch_view, "channels"))
 
         self.model_item = MDNavigationRailItem(
             text="Model",
             icon="tune",
         )
-        self.model_item.bind(on_release=lambda x: self._switch_view("model"))
+        self.model_item.bind(on_release=partial(self._switch_view, "model"))
 
         self.system_item = MDNavigationRailItem(
             text="System",
             icon="cog",
         )
-        self.system_item.bind(on_release=lambda x: self._switch_view("system"))
+        self.system_item.bind(on_release=partial(self._switch_view, "system"))
 
         # Add items to navigation rail
         self._nav_rail.add_widget(self.channels_item)
@@ -93,7 +95,7 @@ class MainNavigationRail(MDBoxLayout):
         # Expose channel panel for compatibility
         self.channel_panel = self.channels_view.channel_panel
 
-    def _switch_view(self, view_name):
+    def _switch_view(self, view_name, *_):
         """Switch to the specified view."""
         if view_name in self._views and view_name != self._current_view:
             # Remove current view
@@ -7,7 +7,6 @@ Uses navigation rail with live channel display and placeholder pages for model/s
 import sys
 import asyncio
 import threading
-import importlib.util
 from pathlib import Path
 
 from kivy.config import Config
@@ -25,6 +24,7 @@ from kivy.core.window import Window
 
 from ..logging import init_logging, get_logger
 from ..settings import MODELS_DIR, LAST_MODEL_FILE
+from ..domain import ModelRepository
 from .components.navigation_rail import MainNavigationRail
 
 log = get_logger(__name__)
@@ -38,9 +38,16 @@ class PiTxApp(MDApp):
         self.channel_panel = None
         self._last_snapshot = None
         self.current_model = None
+        self._value_names: list[str] = []  # Snapshot order, cached per model
         self._listen_thread = None
         self._event_loop = None
         self._models_dir = MODELS_DIR
+        # Refresh at most 20 times a second, and only after the model reports
+        # a change (triggers are safe to fire from the input thread)
+        self._refresh_trigger = Clock.create_trigger(
+            self._poll_store_and_refresh, 1.0 / 20.0
+        )
+        self._repository = ModelRepository(MODELS_DIR)
         
         # Add models directory to path
         sys.path.insert(0, str(self._models_dir))
@@ -77,9 +84,6 @@ class PiTxApp(MDApp):
         # Load the last selected model or default to cat_d6t
         self._load_initial_model()
 
-        # Schedule polling of model values at 20Hz
-        Clock.schedule_interval(self._poll_store_and_refresh, 1.0 / 20.0)
-
         screen.add_widget(root)
         screen_manager.add_widget(screen)
         return screen_manager
@@ -87,19 +91,27 @@ class PiTxApp(MDApp):
     def _load_initial_model(self):
         """Load the initial model (last selected or default)."""
         try:
+            saved_name = None  # Name already stored in LAST_MODEL_FILE
             if LAST_MODEL_FILE.exists():
                 model_name = LAST_MODEL_FILE.read_text().strip()
+                saved_name = model_name
                 log.info(f"Loading last selected model: {model_name}")
             else:
                 model_name = "cat_d6t"
                 log.info(f"No last model found, defaulting to: {model_name}")
             
             model_path = self._models_dir / f"{model_name}.py"
-            if model_path.exists():
-                self._load_model(model_name, model_path)
-            else:
+            if not model_path.exists():
                 log.error(f"Model file not found: {model_path}, trying cat_d6t")
-                self._load_model("cat_d6t", self._models_dir / "cat_d6t.py")
+                model_name = "cat_d6t"
+                model_path = self._models_dir / "cat_d6t.py"
+            self._load_model(model_name, model_path)
+
+            # The model page shows the selection but no longer reads the file itself
+            if getattr(self, "model_settings_view", None):
+                self.model_settings_view.set_current_model(
+                    model_name, saved=model_name == saved_name
+                )
         except Exception as e:
             log.error(f"Failed to load initial model: {e}", exc_info=True)
 
@@ -116,35 +128,24 @@ class PiTxApp(MDApp):
                 old_model_name = self.current_model.name if hasattr(self.current_model, 'name') else 'unknown'
                 log.info(f"Disconnecting current model: {old_model_name}")
                 self._stop_model_listening()
-                
-            # Load the model module
-            spec = importlib.util.spec_from_file_location(model_name, model_path)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Cannot load model from {model_path}")
-            
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Get the model instance (convention: model variable has same name as file)
-            if hasattr(module, model_name):
-                model = getattr(module, model_name)
-            else:
-                # Try to find any Model instance in the module
-                from ..domain import Model
-                model = None
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if isinstance(attr, Model):
-                        model = attr
-                        break
-                if model is None:
-                    raise AttributeError(f"No Model instance found in {model_name}")
-            
+                self.current_model.set_change_listener(None)
+                # Forget the stopped model until the new one has loaded, so a
+                # failed load never leaves it looking loaded
+                self.current_model = None
+                self._value_names = []
+
+            # Load the model module (compiled code is cached per file version)
+            model = self._repository.load(model_name, model_path)
+
             self.current_model = model
+            self._value_names = [value.name for value in model.values]
+            self._last_snapshot = None  # Panel is rebuilt, so repaint everything
+            model.set_change_listener(self._refresh_trigger)
             log.info(f"Loaded model: {model.name}")
             
             # Initialize the channel panel with the new model
             self._initialize_model_channels()
+            self._refresh_trigger()
             
             # Start the model's listener
             self._start_model_listening()
@@ -160,9 +161,11 @@ class PiTxApp(MDApp):
             
         try:
             # Build channel mapping from the current model
+            # Keyed by channel number directly; the panel no longer has to
+            # parse string keys back into ints
             mapping = {}
             for i, value in enumerate(self.current_model.values, start=1):
-                mapping[str(i)] = {
+                mapping[i] = {
                     "name": value.name,
                     "control_type": "bipolar",  # Default to bipolar
                     "device_path": None,  # Virtual channels
@@ -225,8 +228,9 @@ class PiTxApp(MDApp):
         log.info("Started model connection in background thread")
 
     def _poll_store_and_refresh(self, dt):
-        """Poll the model and update UI if values changed."""
-        if not self.current_model:
+        """Read the model and update the UI if values changed."""
+        # Nothing is displayed without a panel or channels, so skip the read
+        if not self.current_model or not self.channel_panel or not self._value_names:
             return
             
         try:
@@ -234,13 +238,22 @@ class PiTxApp(MDApp):
             values = self.current_model.readValues()
 
             # Convert to list for channel_panel (which expects a list)
-            snap = [values.get(val.name, 0.0) for val in self.current_model.values]
+            snap = [values.get(name, 0.0) for name in self._value_names]
 
             # Only update UI if snapshot actually changed
-            if snap != self._last_snapshot:
-                self._last_snapshot = snap[:]  # Store a copy
-                if self.channel_panel:
+            last = self._last_snapshot
+            if snap != last:
+                self._last_snapshot = snap
+                if last is None or len(last) != len(snap):
                     self.channel_panel.update_values(snap)
+                else:
+                    # Hand the panel just the channels that moved
+                    changes = {
+                        i: val
+                        for i, (val, old) in enumerate(zip(snap, last))
+                        if val != old
+                    }
+                    self.channel_panel.update_changed(changes)
         except Exception as e:
             log.error(f"Poll/refresh error: {e}")
 
@@ -1,8 +1,10 @@
 """Model selection page for switching between RC models."""
 
 from __future__ import annotations
+import os
 import sys
-import importlib.util
+import threading
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
@@ -10,10 +12,12 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.list import MDList, OneLineAvatarIconListItem, IconLeftWidget
 from kivymd.uix.label import MDLabel
 from kivy.uix.scrollview import ScrollView
+from kivy.clock import Clock
 from kivy.metrics import dp
 
 from ....settings import MODELS_DIR, LAST_MODEL_FILE
 from ....logging import get_logger
+from ....domain import ModelRepository
 
 # Add models directory to path
 sys.path.insert(0, str(MODELS_DIR))
@@ -24,29 +28,17 @@ log = get_logger(__name__)
 class ModelListItem(OneLineAvatarIconListItem):
     """List item for a model with icon."""
 
-    def __init__(
-        self, model_name: str, model_path: Path, icon: str, on_select_callback, **kwargs
-    ):
+    def __init__(self, model_name: str, model_path: Path, icon: str, **kwargs):
         super().__init__(**kwargs)
         self.model_name = model_name
         self.model_path = model_path
-        self.on_select_callback = on_select_callback
 
         # Set up the list item
         self.text = model_name
 
         # Add icon on the left
-        icon_widget = IconLeftWidget(icon=icon)
-        self.add_widget(icon_widget)
-
-        # Handle click
-        self.on_release = self._on_item_click
-
-    def _on_item_click(self):
-        """Handle item click - switch to this model."""
-        log.info(f"Model selected: {self.model_name}")
-        if self.on_select_callback:
-            self.on_select_callback(self.model_name, self.model_path)
+        self.icon_widget = IconLeftWidget(icon=icon)
+        self.add_widget(self.icon_widget)
 
 
 class ModelPage(MDBoxLayout):
@@ -56,6 +48,8 @@ class ModelPage(MDBoxLayout):
         super().__init__(orientation="vertical", **kwargs)
         self.on_model_changed = on_model_changed
         self.current_model = None
+        self._saved_model: Optional[str] = None  # Last name written to LAST_MODEL_FILE
+        self._repository = ModelRepository(MODELS_DIR)
 
         # Ensure page fills available space
         self.size_hint = (1, 1)
@@ -83,73 +77,56 @@ class ModelPage(MDBoxLayout):
         scroll.add_widget(self.model_list)
         self.add_widget(scroll)
 
-        # Load the last selected model
-        self._load_last_model()
-
     def _load_models(self):
         """Load all available models from the models directory."""
         if not MODELS_DIR.exists():
             log.error(f"Models directory not found: {MODELS_DIR}")
             return
 
-        # Find all Python files in models directory (excluding __pycache__)
-        model_files = sorted(
-            [f for f in MODELS_DIR.glob("*.py") if not f.name.startswith("_")]
-        )
-
-        log.info(f"Found {len(model_files)} model files in {MODELS_DIR}")
+        # Find all model modules in the models directory (excluding private ones)
+        model_names = self._repository.list_models()
 
-        for model_file in model_files:
-            model_name = model_file.stem
-
-            # Load the model to get its icon
-            icon = self._get_model_icon(model_name, model_file)
+        log.info(f"Found {len(model_names)} model files in {MODELS_DIR}")
 
+        items = []
+        for model_name in model_names:
             item = ModelListItem(
                 model_name=model_name,
-                model_path=model_file,
-                icon=icon,
-                on_select_callback=self._on_model_selected,
+                model_path=self._repository.path_for(model_name),
+                icon=ModelRepository.DEFAULT_ICON,
             )
+            # One shared handler for all items; it reads the model off the item
+            item.bind(on_release=self._on_item_release)
             self.model_list.add_widget(item)
+            items.append(item)
+
+        # Getting an icon means executing the model module, so do it off the UI thread
+        threading.Thread(target=self._resolve_icons, args=(items,), daemon=True).start()
+
+    def _resolve_icons(self, items: list[ModelListItem]):
+        """Load model icons in a worker thread and apply them on the UI thread."""
+        icons = {
+            item.model_name: self._get_model_icon(item.model_name, item.model_path)
+            for item in items
+        }
+        Clock.schedule_once(partial(self._apply_icons, items, icons))
+
+    def _apply_icons(self, items: list[ModelListItem], icons: dict[str, str], *_):
+        for item in items:
+            item.icon_widget.icon = icons[item.model_name]
 
     def _get_model_icon(self, model_name: str, model_path: Path) -> str:
         """Load a model file and extract its icon."""
         try:
-            # Load the model module
-            spec = importlib.util.spec_from_file_location(model_name, model_path)
-            if spec is None or spec.loader is None:
-                log.warning(f"Cannot load model from {model_path}")
-                return "excavator"  # Default icon
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Get the model instance (convention: model variable has same name as file)
-            if hasattr(module, model_name):
-                model = getattr(module, model_name)
-                if hasattr(model, "icon"):
-                    # Icon can be either a ModelIcon enum or a string
-                    icon = model.icon
-                    return icon.value if hasattr(icon, 'value') else str(icon)
-            else:
-                # Try to find any Model instance in the module
-                from ....domain import Model
-
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if isinstance(attr, Model):
-                        if hasattr(attr, "icon"):
-                            # Icon can be either a ModelIcon enum or a string
-                            icon = attr.icon
-                            return icon.value if hasattr(icon, 'value') else str(icon)
-                        break
-
-            # Default if no icon found
-            return "excavator"
+            return self._repository.icon_for(model_name, model_path)
         except Exception as e:
             log.warning(f"Failed to load icon for {model_name}: {e}")
-            return "excavator"  # Default icon
+            return ModelRepository.DEFAULT_ICON  # Default icon
+
+    def _on_item_release(self, item: ModelListItem):
+        """Handle item click - switch to this model."""
+        log.info(f"Model selected: {item.model_name}")
+        self._on_model_selected(item.model_name, item.model_path)
 
     def _on_model_selected(self, model_name: str, model_path: Path):
         """Handle model selection."""
@@ -172,24 +149,33 @@ class ModelPage(MDBoxLayout):
 
     def _save_last_model(self, model_name: str):
         """Save the last selected model to a file."""
+        if model_name == self._saved_model:
+            return
         try:
-            LAST_MODEL_FILE.write_text(model_name)
+            # Write a temp file and rename it over the old one so a power cut
+            # never leaves a truncated file behind
+            tmp_path = LAST_MODEL_FILE.with_name(LAST_MODEL_FILE.name + ".tmp")
+            with open(tmp_path, "w") as f:
+                f.write(model_name)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, LAST_MODEL_FILE)
+            self._saved_model = model_name
             log.info(f"Saved last model: {model_name}")
         except Exception as e:
             log.error(f"Failed to save last model: {e}")
 
-    def _load_last_model(self):
-        """Load and highlight the last selected model."""
-        try:
-            if LAST_MODEL_FILE.exists():
-                last_model = LAST_MODEL_FILE.read_text().strip()
-                self.current_model = last_model
-                log.info(f"Last model loaded: {last_model}")
-
-                # Highlight the current model in the list
-                self._update_highlight(last_model)
-        except Exception as e:
-            log.error(f"Failed to load last model: {e}")
+    def set_current_model(self, model_name: str, saved: bool = False):
+        """
+        Mark a model loaded elsewhere (e.g. at startup) as the current one.
+
+        Pass saved=True when model_name is what LAST_MODEL_FILE already holds,
+        so selecting it again does not rewrite the file.
+        """
+        self.current_model = model_name
+        if saved:
+            self._saved_model = model_name
+        self._update_highlight(model_name)
 
     def _update_highlight(self, model_name: str):
         """Update the visual highlight for the selected model."""
@@ -0,0 +1,81 @@
+"""
+Unit tests for DeviceWatcher hot-plug detection.
+"""
+
+import os
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+from pi_tx.domain.device_watcher import DeviceWatcher
+
+
+class TestDeviceWatcher:
+    """Test DeviceWatcher against a temporary directory."""
+
+    def test_reports_created_paths(self, tmp_path):
+        """Files created in the watched directory are reported."""
+        watcher = DeviceWatcher()
+        try:
+            target = tmp_path / "event-joystick"
+            assert watcher.watch(str(target))
+            assert watcher.read_paths() == []
+
+            target.touch()
+            assert watcher.read_paths() == [str(target)]
+            assert watcher.read_paths() == []
+        finally:
+            watcher.close()
+
+    def test_watches_nearest_existing_parent(self, tmp_path):
+        """A missing directory is watched through its closest existing parent."""
+        watcher = DeviceWatcher()
+        try:
+            target = tmp_path / "by-path" / "event-joystick"
+            assert watcher.watch(str(target))
+
+            (tmp_path / "by-path").mkdir()
+            assert watcher.read_paths() == [str(tmp_path / "by-path")]
+
+            assert watcher.watch(str(target))
+            target.touch()
+            assert watcher.read_paths() == [str(target)]
+        finally:
+            watcher.close()
+
+    def test_close_releases_descriptor(self):
+        """close() releases the inotify file descriptor."""
+        watcher = DeviceWatcher()
+        fd = watcher.fileno()
+        watcher.close()
+        assert watcher.fileno() == -1
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_rewatches_deleted_directory(self, tmp_path):
+        """A deleted and recreated directory is watched again via its parent."""
+        watcher = DeviceWatcher()
+        try:
+            by_path = tmp_path / "by-path"
+            by_path.mkdir()
+            target = by_path / "event-joystick"
+            assert watcher.watch(str(target))
+
+            # udev removes the directory once its last device is unplugged
+            by_path.rmdir()
+            assert watcher.read_paths() == []
+
+            # The dead watch is gone, so this watches the parent instead
+            assert watcher.watch(str(target))
+            by_path.mkdir()
+            assert watcher.read_paths() == [str(by_path)]
+
+            assert watcher.watch(str(target))
+            target.touch()
+            assert watcher.read_paths() == [str(target)]
+        finally:
+            watcher.close()
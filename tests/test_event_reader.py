@@ -0,0 +1,70 @@
+"""
+Unit tests for the raw evdev event reader used by Model.connect().
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from pi_tx.domain.model import _INPUT_EVENT, _read_events
+
+
+def make_pipe():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    return read_fd, write_fd
+
+
+def pack(event_type, code, value):
+    return _INPUT_EVENT.pack(0, 0, event_type, code, value)
+
+
+async def collect(fd, count):
+    events = []
+    async for event in _read_events(fd):
+        events.append(event)
+        if len(events) == count:
+            break
+    return events
+
+
+class TestReadEvents:
+    """Test _read_events() against a pipe standing in for an evdev node."""
+
+    def test_unpacks_batched_events(self):
+        """Several events delivered in one read are all yielded in order."""
+        read_fd, write_fd = make_pipe()
+        try:
+            os.write(write_fd, pack(3, 1, 16383) + pack(0, 0, 0) + pack(1, 289, 1))
+            events = asyncio.run(collect(read_fd, 3))
+            assert events == [(3, 1, 16383), (0, 0, 0), (1, 289, 1)]
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_waits_for_events(self):
+        """An empty device is awaited until data arrives."""
+        read_fd, write_fd = make_pipe()
+
+        async def main():
+            asyncio.get_running_loop().call_later(
+                0.01, os.write, write_fd, pack(3, 0, -5)
+            )
+            return await collect(read_fd, 1)
+
+        try:
+            assert asyncio.run(main()) == [(3, 0, -5)]
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_end_of_file_raises(self):
+        """A vanished device surfaces as OSError."""
+        read_fd, write_fd = make_pipe()
+        os.close(write_fd)
+        try:
+            with pytest.raises(OSError):
+                asyncio.run(collect(read_fd, 1))
+        finally:
+            os.close(read_fd)
@@ -6,6 +6,8 @@ Since latching happens in preProcess (at the input stage), these tests
 simulate the flow by calling preProcess on channels before readValues.
 """
 
+from functools import lru_cache
+
 import pytest
 from pi_tx.domain import (
     Channels,
@@ -17,194 +19,150 @@ from pi_tx.domain.stick_mapping import ControlType
 from test_control import TestControl
 
 
-class TestLatchingInModelProcessing:
-    """Test latching values within full model processing."""
-
-    def test_latching_channel_in_model(self):
-        """Latching should work through full Model.readValues() pipeline."""
-        button_ctrl = TestControl(name="btn", control_type=ControlType.BUTTON)
-        model = Model(
-            name="test",
-            model_id="test123",
-            values=[
-                Value(name="gear", control=button_ctrl, latching=True),
-            ],
-            channels=Channels(),
-        )
-
-        # Simulate input flow: preProcess happens during listen(), then readValues()
-        gear_channel = model.get_value_by_name("gear")
-
-        # Initial state
-        model.raw_values = {"gear": gear_channel.preProcess(0.0)}
-        assert model.readValues()["gear"] == 0.0
+@lru_cache(maxsize=None)
+def control(name, control_type):
+    """
+    Shared TestControl per (name, type).
 
-        # First press
-        model.raw_values = {"gear": gear_channel.preProcess(1.0)}
-        assert model.readValues()["gear"] == 1.0
-
-        # Release
-        model.raw_values = {"gear": gear_channel.preProcess(0.0)}
-        assert model.readValues()["gear"] == 1.0
-
-        # Second press
-        model.raw_values = {"gear": gear_channel.preProcess(1.0)}
-        assert model.readValues()["gear"] == 0.0
-
-    def test_multiple_latching_channels_independent(self):
-        """Multiple latching channels should maintain independent state."""
-        btn1 = TestControl(name="btn1", control_type=ControlType.BUTTON)
-        btn2 = TestControl(name="btn2", control_type=ControlType.BUTTON)
-
-        model = Model(
-            name="test",
-            model_id="test123",
-            values=[
-                Value(name="ch1", control=btn1, latching=True),
-                Value(name="ch2", control=btn2, latching=True),
-            ],
-            channels=Channels(),
-        )
-
-        ch1 = model.get_value_by_name("ch1")
-        ch2 = model.get_value_by_name("ch2")
-
-        # Toggle ch1 on
-        model.raw_values = {"ch1": ch1.preProcess(0.0), "ch2": ch2.preProcess(0.0)}
-        model.readValues()
-        model.raw_values = {"ch1": ch1.preProcess(1.0), "ch2": ch2.preProcess(0.0)}
-        result = model.readValues()
-        assert result["ch1"] == 1.0
-        assert result["ch2"] == 0.0
-
-        # Toggle ch2 on (ch1 stays on)
-        model.raw_values = {"ch1": ch1.preProcess(1.0), "ch2": ch2.preProcess(0.0)}
-        model.readValues()
-        model.raw_values = {"ch1": ch1.preProcess(1.0), "ch2": ch2.preProcess(1.0)}
-        result = model.readValues()
-        assert result["ch1"] == 1.0
-        assert result["ch2"] == 1.0
-
-        # Toggle ch1 off (ch2 stays on)
-        model.raw_values = {"ch1": ch1.preProcess(1.0), "ch2": ch2.preProcess(1.0)}
-        model.readValues()
-        model.raw_values = {"ch1": ch1.preProcess(0.0), "ch2": ch2.preProcess(1.0)}
-        model.readValues()
-        model.raw_values = {"ch1": ch1.preProcess(1.0), "ch2": ch2.preProcess(1.0)}
-        result = model.readValues()
-        assert result["ch1"] == 0.0
-        assert result["ch2"] == 1.0
-
-    def test_latching_with_reversing_in_model(self):
-        """Latching combined with reversing in model context."""
-        btn = TestControl(name="btn", control_type=ControlType.UNIPOLAR)
-        model = Model(
-            name="test",
-            model_id="test123",
-            values=[
-                Value(name="ch1", control=btn, latching=True, reversed=True),
-            ],
-            channels=Channels(),
-        )
-
-        ch1 = model.get_value_by_name("ch1")
-
-        # Initial: preProcess 0.0 -> 0.0, postProcess reversed -> 1.0
-        model.raw_values = {"ch1": ch1.preProcess(0.0)}
-        assert model.readValues()["ch1"] == 1.0
-
-        # Toggle: preProcess 1.0 -> 1.0, postProcess reversed -> 0.0
-        model.raw_values = {"ch1": ch1.preProcess(1.0)}
-        assert model.readValues()["ch1"] == 0.0
+    Controls carry no per-value state (latching lives on Value), so tests
+    can reuse one instance instead of building their own.
+    """
+    return TestControl(name=name, control_type=control_type)
 
-        # Release: preProcess 0.0 -> stays 1.0, postProcess reversed -> 0.0
-        model.raw_values = {"ch1": ch1.preProcess(0.0)}
-        assert model.readValues()["ch1"] == 0.0
 
-        # Toggle again: preProcess 1.0 -> 0.0, postProcess reversed -> 1.0
-        model.raw_values = {"ch1": ch1.preProcess(1.0)}
-        assert model.readValues()["ch1"] == 1.0
+@pytest.fixture
+def make_model():
+    """Build a test Model around the given values (and optional mixes)."""
 
-    def test_latching_with_endpoints_in_model(self):
-        """Latching combined with endpoints in model context."""
-        btn = TestControl(name="btn", control_type=ControlType.BUTTON)
-        model = Model(
+    def make(*values, mixes=()):
+        return Model(
             name="test",
             model_id="test123",
-            values=[
-                Value(
-                    name="ch1",
-                    control=btn,
-                    latching=True,
-                    endpoint=Endpoint(min=0.3, max=0.7),
-                ),
-            ],
+            values=list(values),
+            mixes=list(mixes),
             channels=Channels(),
         )
 
-        ch1 = model.get_value_by_name("ch1")
-
-        # preProcess 0.0 -> 0.0, postProcess clamped to 0.3
-        model.raw_values = {"ch1": ch1.preProcess(0.0)}
-        assert model.readValues()["ch1"] == 0.3
+    return make
+
+
+# Each case: (id, values, steps). values are (value name, control name,
+# control type, Value kwargs); each step feeds {name: input} through
+# preProcess, calls readValues() and checks {name: expected output}.
+LATCH_CASES = [
+    (
+        # Latching works through the full readValues() pipeline
+        "latching_channel_in_model",
+        [("gear", "btn", ControlType.BUTTON, dict(latching=True))],
+        [
+            ({"gear": 0.0}, {"gear": 0.0}),  # Initial state
+            ({"gear": 1.0}, {"gear": 1.0}),  # First press
+            ({"gear": 0.0}, {"gear": 1.0}),  # Release
+            ({"gear": 1.0}, {"gear": 0.0}),  # Second press
+        ],
+    ),
+    (
+        # Multiple latching values keep independent state
+        "multiple_latching_channels_independent",
+        [
+            ("ch1", "btn1", ControlType.BUTTON, dict(latching=True)),
+            ("ch2", "btn2", ControlType.BUTTON, dict(latching=True)),
+        ],
+        [
+            # Toggle ch1 on
+            ({"ch1": 0.0, "ch2": 0.0}, {}),
+            ({"ch1": 1.0, "ch2": 0.0}, {"ch1": 1.0, "ch2": 0.0}),
+            # Toggle ch2 on (ch1 stays on)
+            ({"ch1": 1.0, "ch2": 0.0}, {}),
+            ({"ch1": 1.0, "ch2": 1.0}, {"ch1": 1.0, "ch2": 1.0}),
+            # Toggle ch1 off (ch2 stays on)
+            ({"ch1": 1.0, "ch2": 1.0}, {}),
+            ({"ch1": 0.0, "ch2": 1.0}, {}),
+            ({"ch1": 1.0, "ch2": 1.0}, {"ch1": 0.0, "ch2": 1.0}),
+        ],
+    ),
+    (
+        # Latching in preProcess, unipolar reversing in postProcess
+        "latching_with_reversing_in_model",
+        [
+            (
+                "ch1",
+                "btn",
+                ControlType.UNIPOLAR,
+                dict(latching=True, reversed=True),
+            )
+        ],
+        [
+            ({"ch1": 0.0}, {"ch1": 1.0}),
+            ({"ch1": 1.0}, {"ch1": 0.0}),
+            ({"ch1": 0.0}, {"ch1": 0.0}),
+            ({"ch1": 1.0}, {"ch1": 1.0}),
+        ],
+    ),
+    (
+        # Latching in preProcess, endpoint clamping in postProcess
+        "latching_with_endpoints_in_model",
+        [
+            (
+                "ch1",
+                "btn",
+                ControlType.BUTTON,
+                dict(latching=True, endpoint=Endpoint(min=0.3, max=0.7)),
+            )
+        ],
+        [
+            ({"ch1": 0.0}, {"ch1": 0.3}),
+            ({"ch1": 1.0}, {"ch1": 0.7}),
+        ],
+    ),
+    (
+        # Switch toggles and stays latched, throttle follows its input
+        "mixed_latching_and_nonlatching_channels",
+        [
+            ("switch", "btn", ControlType.BUTTON, dict(latching=True)),
+            ("throttle", "axis", ControlType.UNIPOLAR, dict(latching=False)),
+        ],
+        [
+            ({"switch": 0.0, "throttle": 0.5}, {"switch": 0.0, "throttle": 0.5}),
+            ({"switch": 1.0, "throttle": 0.7}, {"switch": 1.0, "throttle": 0.7}),
+            ({"switch": 0.0, "throttle": 0.3}, {"switch": 1.0, "throttle": 0.3}),
+        ],
+    ),
+]
 
-        # preProcess 1.0 -> 1.0, postProcess clamped to 0.7
-        model.raw_values = {"ch1": ch1.preProcess(1.0)}
-        assert model.readValues()["ch1"] == 0.7
 
-    def test_mixed_latching_and_nonlatching_channels(self):
-        """Model with both latching and non-latching channels."""
-        btn = TestControl(name="btn", control_type=ControlType.BUTTON)
-        axis = TestControl(name="axis", control_type=ControlType.UNIPOLAR)
+class TestLatchingInModelProcessing:
+    """Test latching values within full model processing."""
 
-        model = Model(
-            name="test",
-            model_id="test123",
-            values=[
-                Value(name="switch", control=btn, latching=True),
-                Value(name="throttle", control=axis, latching=False),
-            ],
-            channels=Channels(),
+    @pytest.mark.parametrize(
+        "values,steps",
+        [case[1:] for case in LATCH_CASES],
+        ids=[case[0] for case in LATCH_CASES],
+    )
+    def test_latching_sequence(self, make_model, values, steps):
+        """readValues() results follow the scripted input sequence."""
+        model = make_model(
+            *(
+                Value(name=name, control=control(ctrl_name, ctrl_type), **kwargs)
+                for name, ctrl_name, ctrl_type, kwargs in values
+            )
         )
 
-        switch_ch = model.get_value_by_name("switch")
-        throttle_ch = model.get_value_by_name("throttle")
-
-        # Switch toggles, throttle passes through
-        model.raw_values = {
-            "switch": switch_ch.preProcess(0.0),
-            "throttle": throttle_ch.preProcess(0.5),
-        }
-        result = model.readValues()
-        assert result["switch"] == 0.0
-        assert result["throttle"] == 0.5
-
-        model.raw_values = {
-            "switch": switch_ch.preProcess(1.0),
-            "throttle": throttle_ch.preProcess(0.7),
-        }
-        result = model.readValues()
-        assert result["switch"] == 1.0
-        assert result["throttle"] == 0.7
-
-        model.raw_values = {
-            "switch": switch_ch.preProcess(0.0),
-            "throttle": throttle_ch.preProcess(0.3),
-        }
-        result = model.readValues()
-        assert result["switch"] == 1.0  # Stays latched
-        assert result["throttle"] == 0.3  # Follows input
+        # Simulate input flow: preProcess happens during listen(), then readValues()
+        for step, (inputs, expected) in enumerate(steps):
+            model.raw_values = {
+                name: model.get_value_by_name(name).preProcess(given)
+                for name, given in inputs.items()
+            }
+            result = model.readValues()
+            for name, value in expected.items():
+                assert result[name] == value, f"step {step}: {name}"
 
-    def test_latching_state_persists_across_readvalues_calls(self):
+    def test_latching_state_persists_across_readvalues_calls(self, make_model):
         """Latching state should persist across multiple readValues() calls."""
-        btn = TestControl(name="btn", control_type=ControlType.BUTTON)
-        model = Model(
-            name="test",
-            model_id="test123",
-            values=[
-                Value(name="ch1", control=btn, latching=True),
-            ],
-            channels=Channels(),
+        btn = control("btn", ControlType.BUTTON)
+        model = make_model(
+            Value(name="ch1", control=btn, latching=True),
         )
 
         ch1 = model.get_value_by_name("ch1")
@@ -231,28 +189,24 @@ class TestLatchingInModelProcessing:
             result = model.readValues()
             assert result["ch1"] == 0.0  # Should stay off
 
-    def test_latching_with_all_features(self):
+    def test_latching_with_all_features(self, make_model):
         """Test latching combined with reversing, endpoints, and mixes."""
         from pi_tx.domain import AggregateMix, AggregateSource
 
-        btn = TestControl(name="btn", control_type=ControlType.BUTTON)
-        axis = TestControl(name="axis", control_type=ControlType.UNIPOLAR)
-        output = TestControl(name="output", control_type=ControlType.UNIPOLAR)
-
-        model = Model(
-            name="test",
-            model_id="test123",
-            values=[
-                Value(
-                    name="switch",
-                    control=btn,
-                    latching=True,
-                    reversed=True,
-                    endpoint=Endpoint(min=0.2, max=0.8),
-                ),
-                Value(name="throttle", control=axis),
-                Value(name="combined", control=output),
-            ],
+        btn = control("btn", ControlType.BUTTON)
+        axis = control("axis", ControlType.UNIPOLAR)
+        output = control("output", ControlType.UNIPOLAR)
+
+        model = make_model(
+            Value(
+                name="switch",
+                control=btn,
+                latching=True,
+                reversed=True,
+                endpoint=Endpoint(min=0.2, max=0.8),
+            ),
+            Value(name="throttle", control=axis),
+            Value(name="combined", control=output),
             mixes=[
                 AggregateMix(
                     sources=[
@@ -262,7 +216,6 @@ class TestLatchingInModelProcessing:
                     target_channel="combined",
                 ),
             ],
-            channels=Channels(),
         )
 
         switch_ch = model.get_value_by_name("switch")
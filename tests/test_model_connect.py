@@ -0,0 +1,247 @@
+"""
+Integration tests for Model.connect() event handling.
+
+Input devices are replaced by pipes carrying raw evdev events, so the
+monitor tasks, hot-plug handling and change notifications run unchanged.
+"""
+
+import asyncio
+import os
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+import pi_tx.domain.model as model_module
+from pi_tx.domain import Channels, Model, Value
+from pi_tx.domain.model import _INPUT_EVENT
+from pi_tx.domain.stick_mapping import ButtonControl, ControlType, EventType
+
+EV_KEY = 1
+BTN_TRIGGER = 288
+
+
+@dataclass
+class PathControl(ButtonControl):
+    """Button bound to an explicit device path instead of a stick."""
+
+    path: str = ""
+
+    @property
+    def device_path(self):
+        return self.path
+
+
+class FakeDevice:
+    """Pipe-backed stand-in for evdev.InputDevice."""
+
+    opened = []
+
+    def __init__(self, path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self.name = "fake"
+        self.fd, self._write_fd = os.pipe()
+        os.set_blocking(self.fd, False)
+        FakeDevice.opened.append(self)
+
+    def send(self, event_type, code, value):
+        os.write(self._write_fd, _INPUT_EVENT.pack(0, 0, event_type, code, value))
+
+    def unplug(self):
+        """Close the writing end; the reader sees end-of-file like a lost device."""
+        os.close(self._write_fd)
+        self._write_fd = -1
+
+    def close(self):
+        if self._write_fd >= 0:
+            os.close(self._write_fd)
+            self._write_fd = -1
+        os.close(self.fd)
+
+
+@pytest.fixture
+def fake_devices(monkeypatch):
+    FakeDevice.opened = []
+    monkeypatch.setattr(model_module, "InputDevice", FakeDevice)
+    return FakeDevice.opened
+
+
+def make_model(device_path, latching=False):
+    button = PathControl(
+        event_code=BTN_TRIGGER,
+        event_type=EventType.KEY,
+        name="trigger",
+        control_type=ControlType.BUTTON,
+        path=str(device_path),
+    )
+    return Model(
+        name="test",
+        model_id="test123",
+        values=[Value(name="ch1", control=button, latching=latching)],
+        channels=Channels(),
+    )
+
+
+async def press(device, value):
+    """Send a trigger event and give the monitor time to handle it.
+
+    Waits past the 10 ms per-event rate limit so every event is eligible.
+    """
+    device.send(EV_KEY, BTN_TRIGGER, value)
+    await asyncio.sleep(0.02)
+
+
+async def wait_for(condition, timeout=1.0):
+    """Yield to the event loop until condition() holds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+class TestHotPlug:
+    """Test devices appearing and disappearing while connected."""
+
+    def test_replug_after_directory_removed(self, tmp_path, fake_devices):
+        """A device is reopened after its by-path directory was deleted and recreated."""
+        by_path = tmp_path / "by-path"
+        by_path.mkdir()
+        node = by_path / "event-joystick"
+        node.touch()
+        model = make_model(node)
+
+        async def main():
+            await model.connect()
+            try:
+                await wait_for(lambda: len(fake_devices) == 1)
+
+                # Unplug: the node and then the by-path directory disappear
+                fake_devices[0].unplug()
+                await wait_for(lambda: not model._devices)
+                # The finished monitor task is not kept around
+                await wait_for(lambda: not model._tasks)
+                node.unlink()
+                by_path.rmdir()
+                await asyncio.sleep(0.02)
+
+                # Replug: udev recreates the directory, then the node
+                by_path.mkdir()
+                await asyncio.sleep(0.02)
+                node.touch()
+                await wait_for(lambda: len(model._devices) == 1)
+                assert len(fake_devices) == 2
+                assert len(model._tasks) == 1
+            finally:
+                await model.disconnect()
+
+        asyncio.run(main())
+
+
+class TestEventDedupe:
+    """Test that repeated raw values are dropped before processing."""
+
+    def test_repeated_raw_value_is_dropped(self, tmp_path, fake_devices):
+        """A raw value equal to the last one handled never reaches preProcess."""
+        node = tmp_path / "event-joystick"
+        node.touch()
+        model = make_model(node)
+        value = model.get_value_by_name("ch1")
+        seen = []
+        process = value.preProcess
+        value.preProcess = lambda v: seen.append(v) or process(v)
+
+        async def main():
+            await model.connect()
+            try:
+                device = fake_devices[0]
+                await press(device, 1)
+                await press(device, 1)
+                await press(device, 0)
+                await press(device, 0)
+                await press(device, 1)
+            finally:
+                await model.disconnect()
+
+        asyncio.run(main())
+        assert seen == [1.0, 0.0, 1.0]
+
+    def test_press_release_press_toggles_latch(self, tmp_path, fake_devices):
+        """Releases are not deduplicated away, so every press toggles the latch."""
+        node = tmp_path / "event-joystick"
+        node.touch()
+        model = make_model(node, latching=True)
+
+        async def main():
+            await model.connect()
+            try:
+                device = fake_devices[0]
+                states = []
+                for raw in (1, 0, 1, 1, 0, 1):
+                    await press(device, raw)
+                    states.append(model.raw_values["ch1"])
+                return states
+            finally:
+                await model.disconnect()
+
+        assert asyncio.run(main()) == [1.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+
+
+class TestChangeListener:
+    """Test Model.set_change_listener() notifications from connect()."""
+
+    def test_listener_follows_value_changes_and_unplug(self, tmp_path, fake_devices):
+        """Notified on a changed value and on unplug, not on a dropped repeat."""
+        node = tmp_path / "event-joystick"
+        node.touch()
+        model = make_model(node)
+        calls = []
+        model.set_change_listener(lambda: calls.append(dict(model.raw_values)))
+
+        async def main():
+            await model.connect()
+            try:
+                device = fake_devices[0]
+                await press(device, 1)
+                assert calls == [{"ch1": 1.0}]
+
+                # Same raw value again: dropped, so nothing to redraw
+                await press(device, 1)
+                assert len(calls) == 1
+
+                await press(device, 0)
+                assert calls[-1] == {"ch1": 0.0}
+
+                # Unplugging resets the value to neutral and notifies once more
+                device.unplug()
+                await wait_for(lambda: len(calls) == 3)
+                assert calls[-1] == {}
+            finally:
+                await model.disconnect()
+
+        asyncio.run(main())
+
+    def test_cleared_listener_is_not_called(self, tmp_path, fake_devices):
+        """set_change_listener(None) stops notifications."""
+        node = tmp_path / "event-joystick"
+        node.touch()
+        model = make_model(node)
+        calls = []
+        model.set_change_listener(lambda: calls.append(1))
+        model.set_change_listener(None)
+
+        async def main():
+            await model.connect()
+            try:
+                await press(fake_devices[0], 1)
+                assert model.raw_values == {"ch1": 1.0}
+            finally:
+                await model.disconnect()
+
+        asyncio.run(main())
+        assert calls == []
@@ -0,0 +1,65 @@
+"""
+Tests for persisting the selected model on the ModelPage.
+
+Kivy runs with a mock GL backend; LAST_MODEL_FILE is redirected to a
+temporary directory.
+"""
+
+import os
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+os.environ.setdefault("KIVY_GL_BACKEND", "mock")
+
+import pytest
+
+model_page = pytest.importorskip("pi_tx.ui.pages.model.model_page")
+
+
+@pytest.fixture
+def page(tmp_path, monkeypatch):
+    from kivymd.app import MDApp
+
+    # KivyMD widgets need an app instance for their theme
+    if MDApp.get_running_app() is None:
+        MDApp()
+    last_model = tmp_path / ".last_model"
+    monkeypatch.setattr(model_page, "LAST_MODEL_FILE", last_model)
+    page = model_page.ModelPage()
+    page.last_model = last_model
+    return page
+
+
+def file_version(path):
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns
+
+
+class TestLastModelPersistence:
+    """Test that selections are written to LAST_MODEL_FILE only when they change."""
+
+    def test_reselecting_startup_model_does_not_write(self, page):
+        """The model restored from the file is not written back when selected."""
+        page.last_model.write_text("cat_d6t")
+        before = file_version(page.last_model)
+
+        page.set_current_model("cat_d6t", saved=True)
+        page._on_model_selected("cat_d6t", page._repository.path_for("cat_d6t"))
+
+        assert file_version(page.last_model) == before
+        assert page.current_model == "cat_d6t"
+
+    def test_other_selection_is_written(self, page):
+        """Selecting a different model replaces the stored name."""
+        page.last_model.write_text("cat_d6t")
+        page.set_current_model("cat_d6t", saved=True)
+
+        page._on_model_selected("cat_950m", page._repository.path_for("cat_950m"))
+        assert page.last_model.read_text() == "cat_950m"
+
+    def test_unsaved_startup_model_is_written(self, page):
+        """A fallback model that is not in the file yet is saved when selected."""
+        page.set_current_model("cat_d6t")
+
+        page._on_model_selected("cat_d6t", page._repository.path_for("cat_d6t"))
+        assert page.last_model.read_text() == "cat_d6t"
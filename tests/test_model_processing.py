@@ -517,6 +517,59 @@ class TestIntegratedProcessing:
         result2 = model.readValues()
         assert result2["ch1"] == 0.8
 
+    def test_read_values_reverses_once_after_published_dict_is_post_processed(self):
+        """Post-processing the published dict again does not leak into readValues()."""
+        virtual_ctrl = TestControl(name="ctrl", control_type=ControlType.BIPOLAR)
+        model = Model(
+            name="test",
+            model_id="test123",
+            values=[Value(name="ch1", control=virtual_ctrl, reversed=True)],
+            channels=Channels(),
+        )
+
+        model.raw_values = {"ch1": 0.5}
+        result1 = model.readValues()
+        assert result1["ch1"] == -0.5
+
+        # Another caller post-processes the published dict a second time
+        model._postProcess()
+        assert model.processed_values["ch1"] == 0.5
+
+        result2 = model.readValues()
+        assert result2["ch1"] == -0.5
+        # The dict returned earlier is not touched by later calls
+        assert result1 == {"ch1": -0.5}
+
+    def test_read_values_never_publishes_half_processed_values(self):
+        """Callers on other threads only ever see fully post-processed values."""
+        virtual_ctrl = TestControl(name="ctrl", control_type=ControlType.BIPOLAR)
+        model = Model(
+            name="test",
+            model_id="test123",
+            values=[Value(name="ch1", control=virtual_ctrl, reversed=True)],
+            channels=Channels(),
+        )
+        model.raw_values = {"ch1": 0.5}
+        model.readValues()
+
+        # Simulate the UI thread running while the UART thread is half-way
+        # through post-processing
+        seen = []
+        [(name, post_process)] = model._post_steps
+
+        def interleaved_step(value):
+            if not seen:
+                seen.append(dict(model.processed_values))
+                seen.append(model.readValues())
+            return post_process(value)
+
+        model._post_steps = [(name, interleaved_step)]
+        result = model.readValues()
+
+        assert seen == [{"ch1": -0.5}, {"ch1": -0.5}]
+        assert result == {"ch1": -0.5}
+        assert model.processed_values == {"ch1": -0.5}
+
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
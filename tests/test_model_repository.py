@@ -0,0 +1,149 @@
+"""
+Unit tests for ModelRepository.
+
+Tests loading models from a directory of model modules and the compiled
+code cache keyed by file version.
+"""
+
+import os
+
+import pytest
+from pi_tx.domain import Model, ModelRepository
+from pi_tx.domain import model_repository
+
+MODEL_SOURCE = """
+from pi_tx.domain import Model, ModelIcon, Channels
+
+{var} = Model(
+    name="{name}",
+    model_id="id_{name}",
+    icon={icon},
+    values=[],
+    channels=Channels(),
+)
+"""
+
+
+def write_model(directory, name, var=None, icon="ModelIcon.TRACTOR"):
+    path = directory / f"{name}.py"
+    path.write_text(MODEL_SOURCE.format(var=var or name, name=name, icon=icon))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    model_repository._CODE_CACHE.clear()
+    model_repository._LISTING_CACHE.clear()
+    yield
+    model_repository._CODE_CACHE.clear()
+    model_repository._LISTING_CACHE.clear()
+
+
+class TestModelRepositoryLoad:
+    """Test ModelRepository.load()."""
+
+    def test_load_by_convention(self, tmp_path):
+        """The variable named after the file is returned."""
+        write_model(tmp_path, "loader")
+        model = ModelRepository(tmp_path).load("loader")
+        assert isinstance(model, Model)
+        assert model.name == "loader"
+
+    def test_load_falls_back_to_any_model(self, tmp_path):
+        """A Model under another name is found by scanning the module."""
+        write_model(tmp_path, "dozer", var="my_model")
+        assert ModelRepository(tmp_path).load("dozer").name == "dozer"
+
+    def test_load_without_model_raises(self, tmp_path):
+        """Modules without a Model instance are rejected."""
+        (tmp_path / "empty.py").write_text("x = 1\n")
+        with pytest.raises(AttributeError):
+            ModelRepository(tmp_path).load("empty")
+
+    def test_each_load_returns_fresh_instance(self, tmp_path):
+        """Models hold runtime state, so instances are never shared."""
+        write_model(tmp_path, "loader")
+        repo = ModelRepository(tmp_path)
+        first = repo.load("loader")
+        first.raw_values["x"] = 1.0
+        second = repo.load("loader")
+        assert second is not first
+        assert second.raw_values == {}
+
+
+class TestModelRepositoryCache:
+    """Test the compiled code cache."""
+
+    def test_unchanged_file_is_compiled_once(self, tmp_path):
+        """Loading the same file version reuses the compiled code."""
+        write_model(tmp_path, "loader")
+        repo = ModelRepository(tmp_path)
+        repo.load("loader")
+        repo.load("loader")
+        repo.icon_for("loader")
+        assert len(model_repository._CODE_CACHE) == 1
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Editing a model file invalidates the cached code."""
+        path = write_model(tmp_path, "loader")
+        repo = ModelRepository(tmp_path)
+        assert repo.icon_for("loader") == "tractor"
+
+        write_model(tmp_path, "loader", icon='"bulldozer"')
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert repo.icon_for("loader") == "bulldozer"
+
+
+class TestModelRepositoryListing:
+    """Test ModelRepository.list_models()."""
+
+    def test_lists_sorted_public_modules(self, tmp_path):
+        """Private modules, other files and directories are skipped."""
+        write_model(tmp_path, "loader")
+        write_model(tmp_path, "dozer")
+        (tmp_path / "_helpers.py").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "__pycache__").mkdir()
+        assert ModelRepository(tmp_path).list_models() == ["dozer", "loader"]
+
+    def test_listing_follows_directory_changes(self, tmp_path):
+        """Adding or removing a model file is picked up."""
+        repo = ModelRepository(tmp_path)
+        write_model(tmp_path, "loader")
+        assert repo.list_models() == ["loader"]
+
+        path = write_model(tmp_path, "dozer")
+        st = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert repo.list_models() == ["dozer", "loader"]
+
+        path.unlink()
+        st = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert repo.list_models() == ["loader"]
+
+    def test_missing_directory_lists_nothing(self, tmp_path):
+        """A models directory that does not exist has no models."""
+        assert ModelRepository(tmp_path / "missing").list_models() == []
+
+    def test_listing_is_cached(self, tmp_path):
+        """An unchanged directory is not rescanned."""
+        write_model(tmp_path, "loader")
+        repo = ModelRepository(tmp_path)
+        repo.list_models()
+        mtime, _ = model_repository._LISTING_CACHE[str(tmp_path)]
+        model_repository._LISTING_CACHE[str(tmp_path)] = (mtime, ["cached"])
+        assert repo.list_models() == ["cached"]
+
+
+class TestModelRepositoryIcon:
+    """Test ModelRepository.icon_for()."""
+
+    def test_enum_icon(self, tmp_path):
+        write_model(tmp_path, "loader")
+        assert ModelRepository(tmp_path).icon_for("loader") == "tractor"
+
+    def test_string_icon(self, tmp_path):
+        write_model(tmp_path, "loader", icon='"excavator"')
+        assert ModelRepository(tmp_path).icon_for("loader") == "excavator"
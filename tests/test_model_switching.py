@@ -0,0 +1,82 @@
+"""
+Tests for switching models in the PiTxApp UI.
+
+Kivy runs with a mock GL backend; model loading and the input thread are
+replaced so only the switching logic is exercised.
+"""
+
+import os
+from pathlib import Path
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+os.environ.setdefault("KIVY_GL_BACKEND", "mock")
+
+import pytest
+
+main = pytest.importorskip("pi_tx.ui.main")
+
+
+class FakeModel:
+    """Minimal model exposing what PiTxApp uses."""
+
+    def __init__(self, name):
+        self.name = name
+        self.values = []
+        self.listener = None
+
+    def set_change_listener(self, listener):
+        self.listener = listener
+
+
+class FakeRepository:
+    """Returns FakeModels, failing for names listed in broken."""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.loads = []
+
+    def load(self, model_name, model_path=None):
+        self.loads.append(model_name)
+        if model_name in self.broken:
+            raise ImportError(f"Cannot load model from {model_path}")
+        return FakeModel(model_name)
+
+
+@pytest.fixture
+def app():
+    app = main.PiTxApp()
+    app._repository = FakeRepository(broken={"broken"})
+    app.started = []
+    app._start_model_listening = lambda: app.started.append(app.current_model.name)
+    return app
+
+
+class TestModelSwitching:
+    """Test PiTxApp._on_model_changed()."""
+
+    def test_reselecting_loaded_model_reloads_it(self, app):
+        """Selecting the running model again reloads it from disk and restarts it."""
+        app._on_model_changed("loader", Path("loader.py"))
+        first = app.current_model
+
+        app._on_model_changed("loader", Path("loader.py"))
+        assert app._repository.loads == ["loader", "loader"]
+        assert app.current_model is not first
+        assert first.listener is None
+        assert app.current_model.listener is app._refresh_trigger
+        assert app.started == ["loader", "loader"]
+
+    def test_failed_switch_allows_reselecting_previous_model(self, app):
+        """After a failed load the stopped model can be selected again."""
+        app._on_model_changed("loader", Path("loader.py"))
+        previous = app.current_model
+
+        app._on_model_changed("broken", Path("broken.py"))
+        assert app.current_model is None
+        assert previous.listener is None
+
+        app._on_model_changed("loader", Path("loader.py"))
+        assert app._repository.loads == ["loader", "broken", "loader"]
+        assert app.current_model.name == "loader"
+        assert app.started == ["loader", "loader"]
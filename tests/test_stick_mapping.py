@@ -0,0 +1,61 @@
+"""
+Unit tests for stick mapping controls.
+
+Tests AxisControl normalization of raw hardware values into the
+bipolar (-1.0..1.0) and unipolar (0.0..1.0) ranges.
+"""
+
+import pytest
+from pi_tx.domain.stick_mapping import AxisControl, ControlType, EventType
+
+
+def make_axis(control_type=ControlType.BIPOLAR, min_value=0, max_value=16383):
+    return AxisControl(
+        event_code=0,
+        event_type=EventType.ABS,
+        name="axis",
+        control_type=control_type,
+        min_value=min_value,
+        max_value=max_value,
+    )
+
+
+class TestAxisNormalization:
+    """Test AxisControl.normalize()."""
+
+    def test_bipolar_endpoints(self):
+        """Bipolar axes map min/max to -1.0/1.0."""
+        axis = make_axis()
+        assert axis.normalize(0) == -1.0
+        assert axis.normalize(16383) == 1.0
+
+    def test_bipolar_center_deadzone(self):
+        """Values near center snap to 0.0 on bipolar axes."""
+        axis = make_axis()
+        assert axis.normalize(8192) == 0.0
+        assert axis.normalize(8600) == 0.0
+        assert axis.normalize(9000) > 0.05
+
+    def test_bipolar_clamps_out_of_range(self):
+        """Raw values outside min/max are clamped."""
+        axis = make_axis()
+        assert axis.normalize(-100) == -1.0
+        assert axis.normalize(20000) == 1.0
+
+    def test_unipolar_range(self):
+        """Unipolar axes map to 0.0..1.0 without a deadzone."""
+        axis = make_axis(ControlType.UNIPOLAR, max_value=255)
+        assert axis.normalize(0) == 0.0
+        assert axis.normalize(255) == 1.0
+        assert axis.normalize(5) == pytest.approx(5 / 255)
+
+    def test_hat_axis(self):
+        """Three-position hat axes map to -1.0, 0.0 and 1.0."""
+        axis = make_axis(min_value=-1, max_value=1)
+        assert axis.normalize(-1) == -1.0
+        assert axis.normalize(0) == 0.0
+        assert axis.normalize(1) == 1.0
+
+    def test_zero_span(self):
+        """A degenerate range does not divide by zero."""
+        assert make_axis(ControlType.UNIPOLAR, max_value=0).normalize(0) == 0.0
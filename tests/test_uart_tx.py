@@ -0,0 +1,87 @@
+"""
+Unit tests for MultiSerialTX frame streaming.
+"""
+
+import threading
+import time
+
+from pi_tx.domain.uart_tx import MultiSerialTX
+
+
+class RecordingUart:
+    """Stand-in for UartTx that records sent frames."""
+
+    def __init__(self):
+        self.frames = []
+        self.sent = threading.Event()
+
+    def send_bytes(self, data: bytes) -> bool:
+        self.frames.append(data)
+        self.sent.set()
+        return True
+
+
+class TestSenderLoop:
+    """Test the periodic sender thread."""
+
+    def test_sends_frames(self):
+        """Frames are streamed once started."""
+        uart = RecordingUart()
+        tx = MultiSerialTX(uart)
+        tx.start()
+        try:
+            assert uart.sent.wait(1.0)
+        finally:
+            tx.stop()
+        assert uart.frames[0][0] == 0x55
+
+    def test_stop_wakes_sleeping_sender(self):
+        """stop() does not wait out the frame interval."""
+        uart = RecordingUart()
+        tx = MultiSerialTX(uart, frame_rate_hz=0.5)
+        tx.start()
+        assert uart.sent.wait(1.0)
+
+        started = time.perf_counter()
+        tx.stop()
+        assert time.perf_counter() - started < 0.5
+        assert len(uart.frames) == 1
+
+
+class TestBuildFrame:
+    """Test MULTI-serial frame encoding."""
+
+    def test_channels_are_little_endian_11_bit(self):
+        """Each channel is a lo/hi byte pair with the top bits cleared."""
+        tx = MultiSerialTX(RecordingUart(), channel_count=3)
+        tx.set_channels([0, 2047, 5000])
+        frame = tx._build_frame()
+        assert frame[5:11] == bytes([0x00, 0x00, 0xFF, 0x07, 0xFF, 0x07])
+
+    def test_checksum_covers_all_but_header(self):
+        """The last byte is the XOR of every byte after 0x55."""
+        tx = MultiSerialTX(RecordingUart())
+        tx.set_channel(0, 1500)
+        frame = tx._build_frame()
+        checksum = 0
+        for b in frame[1:-1]:
+            checksum ^= b
+        assert frame[-1] == checksum
+        assert len(frame) == 5 + 2 * 14 + 1
+
+
+class TestSetChannels:
+    """Test channel setters."""
+
+    def test_extra_values_are_ignored(self):
+        """Values beyond channel_count are dropped."""
+        tx = MultiSerialTX(RecordingUart(), channel_count=2)
+        tx.set_channels([10, 20, 30])
+        assert list(tx._channels) == [10, 20]
+
+    def test_out_of_range_index_is_ignored(self):
+        """set_channel() ignores indexes outside the channel range."""
+        tx = MultiSerialTX(RecordingUart(), channel_count=2)
+        tx.set_channel(-1, 10)
+        tx.set_channel(2, 10)
+        assert list(tx._channels) == [1024, 1024]